@@ -33,6 +33,7 @@ from trac.config import Configuration
 from trac.core import TracError
 from trac.env import Environment
 from trac.util import translation
+from trac.util.datefmt import time_now
 from trac.util.html import html
 from trac.util.text import console_print, exception_to_unicode, \
                            getpreferredencoding, printerr, printout, \
@@ -53,8 +54,12 @@ class TracAdmin(cmd.Cmd):
     __env = None
     needs_upgrade = None
 
+    # Number of seconds during which the completions of a line are reused
+    COMPLETION_CACHE_EXPIRY = 2
+
     def __init__(self, envdir=None):
         cmd.Cmd.__init__(self)
+        self._completions = None
         if readline:
             delims = readline.get_completer_delims()
             for c in '-/:()\\':
@@ -75,6 +80,7 @@ class TracAdmin(cmd.Cmd):
             else:
                 encoding = getpreferredencoding()  # sys.argv
             line = to_unicode(line, encoding)
+        self._completions = None
         if self.interactive:
             line = line.replace('\\', '\\\\')
         try:
@@ -199,6 +205,20 @@ Type:  '?' or 'help' for help on commands.
     # Command dispatcher
 
     def complete_line(self, text, line, cmd_only=False):
+        # Repeated Tab presses on the same line reuse the previous
+        # completions for a short while, as long as no command is run
+        key = (text, line, cmd_only)
+        now = time_now()
+        if self._completions:
+            timestamp, cached_key, completions = self._completions
+            if cached_key == key and \
+                    now - timestamp <= self.COMPLETION_CACHE_EXPIRY:
+                return list(completions)
+        completions = self._complete_line(text, line, cmd_only)
+        self._completions = (now, key, completions)
+        return list(completions)
+
+    def _complete_line(self, text, line, cmd_only):
         args = self.arg_tokenize(line)
         if line and line[-1] == ' ':    # Space starts new argument
             args.append('')
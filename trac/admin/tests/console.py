@@ -51,6 +51,46 @@ class TracadminTestCase(TracAdminTestCaseBase):
     def tearDown(self):
         self.env = None
 
+    def _patch_time_now(self, now):
+        orig_time_now = trac.admin.console.time_now
+        trac.admin.console.time_now = lambda: now[0]
+        self.addCleanup(setattr, trac.admin.console, 'time_now',
+                        orig_time_now)
+
+    def _complete_component_remove(self):
+        return sorted(self.admin.complete_line('', 'component remove '))
+
+    def test_complete_line_reuses_completions(self):
+        """Completions of a line are reused until a command is run."""
+        now = [1000.0]
+        self._patch_time_now(now)
+        self.env.db_transaction("""
+            INSERT INTO component (name) VALUES ('component1')""")
+        self.assertEqual(['component1 '], self._complete_component_remove())
+
+        self.env.db_transaction("""
+            INSERT INTO component (name) VALUES ('component2')""")
+        now[0] += TracAdmin.COMPLETION_CACHE_EXPIRY
+        self.assertEqual(['component1 '], self._complete_component_remove())
+
+        self.execute('component list')
+        self.assertEqual(['component1', 'component2'],
+                         self._complete_component_remove())
+
+    def test_complete_line_completions_expire(self):
+        """Completions of a line are computed again once expired."""
+        now = [1000.0]
+        self._patch_time_now(now)
+        self.env.db_transaction("""
+            INSERT INTO component (name) VALUES ('component1')""")
+        self.assertEqual(['component1 '], self._complete_component_remove())
+
+        self.env.db_transaction("""
+            INSERT INTO component (name) VALUES ('component2')""")
+        now[0] += TracAdmin.COMPLETION_CACHE_EXPIRY + 0.1
+        self.assertEqual(['component1', 'component2'],
+                         self._complete_component_remove())
+
     def test_help_ok(self):
         """
         Tests the 'help' command in trac-admin.  Since the 'help' command
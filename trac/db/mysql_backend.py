@@ -14,17 +14,20 @@
 # individuals. For the exact contribution history, see the revision
 # history and logs, available at https://trac.edgewall.org/log/.
 
+import gzip
 import os
 import re
+import shutil
 import sys
 from contextlib import closing
 from subprocess import Popen, PIPE
+from tempfile import TemporaryFile
 
 from trac.api import IEnvironmentSetupParticipant
 from trac.core import *
 from trac.config import Option
 from trac.db.api import ConnectionBase, DatabaseManager, IDatabaseConnector, \
-                        get_column_names, parse_connection_uri
+                        parse_connection_uri
 from trac.db.util import ConnectionWrapper, IterableCursor
 from trac.util import as_int, get_pkginfo
 from trac.util.html import Markup
@@ -32,7 +35,7 @@ from trac.util.compat import close_fds
 from trac.util.text import exception_to_unicode, to_unicode
 from trac.util.translation import _
 
-_like_escape_re = re.compile(r'([/_%])')
+_like_escape_table = str.maketrans({'/': '//', '_': '/_', '%': '/%'})
 
 try:
     import pymysql
@@ -50,14 +53,22 @@ else:
             return super().execute(query, args)
 
         def executemany(self, query, args):
-            if args:
-                args = [tuple(str(item) if isinstance(item, Markup) else item
+            # pymysql sends an INSERT ... VALUES query as multi-row
+            # statements bounded by `max_stmt_length`, consuming the rows
+            # lazily, so the converted rows are not materialized here.
+            # The rows are only copied when they contain `Markup` at all.
+            if args and any(isinstance(item, Markup)
+                            for arg in args for item in arg):
+                args = (tuple(str(item) if isinstance(item, Markup) else item
                               for item in arg)
-                        for arg in args]
+                        for arg in args)
             return super().executemany(query, args)
 
         def fetchall(self):
-            return list(super().fetchall())
+            # Callers of `db()` expect a list, while pymysql returns the
+            # buffered result tuple
+            rows = super().fetchall()
+            return rows if isinstance(rows, list) else list(rows)
 
     class MySQLSilentCursor(MySQLUnicodeCursor):
         def _show_warnings(self, conn=None):
@@ -75,6 +86,17 @@ def _quote(identifier):
     return "`%s`" % identifier.replace('`', '``')
 
 
+_placeholders_cache = {}
+
+
+def _placeholders(num):
+    """Return a comma-separated list of `num` parameter placeholders."""
+    try:
+        return _placeholders_cache[num]
+    except KeyError:
+        return _placeholders_cache.setdefault(num, ','.join(('%s',) * num))
+
+
 class MySQLConnector(Component):
     """Database connector for MySQL version 4.1 and greater.
 
@@ -100,6 +122,7 @@ class MySQLConnector(Component):
         """Location of mysqldump for MySQL database backups""")
 
     def __init__(self):
+        self._cached_max_bytes = None
         if pymysql:
             self._mysql_version = \
                 'server: (not-connected), client: "%s", thread-safe: %s' % \
@@ -113,8 +136,10 @@ class MySQLConnector(Component):
         yield 'mysql', 1
 
     def get_connection(self, path, log=None, user=None, password=None,
-                       host=None, port=None, params={}):
-        cnx = MySQLConnection(path, log, user, password, host, port, params)
+                       host=None, port=None, params={},
+                       multi_statements=False):
+        cnx = MySQLConnection(path, log, user, password, host, port, params,
+                              multi_statements=multi_statements)
         if not self.required:
             self._mysql_version = \
                 'server: "%s", client: "%s", thread-safe: %s' \
@@ -129,16 +154,29 @@ class MySQLConnector(Component):
     def init_db(self, path, schema=None, log=None, user=None, password=None,
                 host=None, port=None, params={}):
         cnx = self.get_connection(path, log, user, password, host, port,
-                                  params)
+                                  params, multi_statements=True)
         self._verify_variables(cnx)
         max_bytes = self._max_bytes(cnx)
         cursor = cnx.cursor()
         if schema is None:
             from trac.db_default import schema
-        for table in schema:
-            for stmt in self.to_sql(table, max_bytes=max_bytes):
-                self.log.debug(stmt)
-                cursor.execute(stmt)
+        stmts = [stmt for table in schema
+                      for stmt in self.to_sql(table, max_bytes=max_bytes)]
+        if stmts and cnx.multi_statements:
+            # Send all the statements in a single round-trip
+            sql = ';\n'.join(stmts)
+            self.log.debug(sql)
+            cursor.execute(sql)
+            # execute() only reports an error in the first statement. The
+            # results of the following ones are read by nextset(), which
+            # raises the error of a failed statement, so all the results
+            # must be consumed before verifying the tables and committing.
+            while cursor.nextset():
+                pass
+        else:
+            for sql in stmts:
+                self.log.debug(sql)
+                cursor.execute(sql)
         self._verify_table_status(cnx)
         cnx.commit()
 
@@ -157,13 +195,15 @@ class MySQLConnector(Component):
         return bool(cnx.get_table_names())
 
     def _max_bytes(self, cnx):
-        if cnx is None:
+        if cnx is not None:
+            return 4 if cnx.charset == 'utf8mb4' else 3
+        # The charset of the environment's database doesn't change, so
+        # avoid opening a new connection on each call of `to_sql`.
+        if self._cached_max_bytes is None:
             connector, args = DatabaseManager(self.env).get_connector()
             with closing(connector.get_connection(**args)) as cnx:
-                charset = cnx.charset
-        else:
-            charset = cnx.charset
-        return 4 if charset == 'utf8mb4' else 3
+                self._cached_max_bytes = self._max_bytes(cnx)
+        return self._cached_max_bytes
 
     _max_key_length = 3072
 
@@ -174,28 +214,40 @@ class MySQLConnector(Component):
         Some Versions of MySQL limit each index prefix to 3072 bytes total,
         with a max of 767 bytes per column.
         """
-        cols = []
         limit_col = 767 // max_bytes
         limit = min(self._max_key_length // (max_bytes * len(columns)),
                     limit_col)
-        for c in columns:
-            name = _quote(c)
-            table_col = list(filter((lambda x: x.name == c), table.columns))
-            if len(table_col) == 1 and table_col[0].type.lower() == 'text':
-                if table_col[0].key_size is not None:
-                    name += '(%d)' % min(table_col[0].key_size, limit_col)
-                else:
-                    name += '(%s)' % limit
-            # For non-text columns, we simply throw away the extra bytes.
-            # That could certainly be optimized better, but for now let's KISS.
-            cols.append(name)
-        return ','.join(cols)
+        col_by_name = {col.name: col for col in table.columns}
+        return ','.join(self._format_col(c, col_by_name.get(c), limit,
+                                         limit_col)
+                        for c in columns)
+
+    def _format_col(self, name, column, limit, limit_col):
+        name = _quote(name)
+        if column is not None and column.type.lower() == 'text':
+            if column.key_size is not None:
+                name += '(%d)' % min(column.key_size, limit_col)
+            else:
+                name += '(%s)' % limit
+        # For non-text columns, we simply throw away the extra bytes.
+        # That could certainly be optimized better, but for now let's KISS.
+        return name
 
     def to_sql(self, table, max_bytes=None):
         if max_bytes is None:
             max_bytes = self._max_bytes(None)
-        sql = ['CREATE TABLE %s (' % _quote(table.name)]
-        coldefs = []
+        yield 'CREATE TABLE %s (\n%s\n)' % \
+              (_quote(table.name),
+               ',\n'.join(self._coldefs(table, max_bytes)))
+
+        for index in table.indices:
+            unique = 'UNIQUE' if index.unique else ''
+            idxname = '%s_%s_idx' % (table.name, '_'.join(index.columns))
+            yield 'CREATE %s INDEX %s ON %s (%s)' % \
+                  (unique, _quote(idxname), _quote(table.name),
+                   self._collist(table, index.columns, max_bytes=max_bytes))
+
+    def _coldefs(self, table, max_bytes):
         for column in table.columns:
             ctype = column.type
             ctype = _type_map.get(ctype, ctype)
@@ -204,20 +256,10 @@ class MySQLConnector(Component):
                 # Override the column type, as a text field cannot
                 # use auto_increment.
                 column.type = 'int'
-            coldefs.append('    %s %s' % (_quote(column.name), ctype))
+            yield '    %s %s' % (_quote(column.name), ctype)
         if len(table.key) > 0:
-            coldefs.append('    PRIMARY KEY (%s)' %
-                           self._collist(table, table.key,
-                                         max_bytes=max_bytes))
-        sql.append(',\n'.join(coldefs) + '\n)')
-        yield '\n'.join(sql)
-
-        for index in table.indices:
-            unique = 'UNIQUE' if index.unique else ''
-            idxname = '%s_%s_idx' % (table.name, '_'.join(index.columns))
-            yield 'CREATE %s INDEX %s ON %s (%s)' % \
-                  (unique, _quote(idxname), _quote(table.name),
-                   self._collist(table, index.columns, max_bytes=max_bytes))
+            yield '    PRIMARY KEY (%s)' % \
+                  self._collist(table, table.key, max_bytes=max_bytes)
 
     def alter_column_types(self, table, columns):
         """Yield SQL statements altering the type of one or more columns of
@@ -226,15 +268,12 @@ class MySQLConnector(Component):
         Type changes are specified as a `columns` dict mapping column names
         to `(from, to)` SQL type tuples.
         """
-        alterations = []
-        for name, (from_, to) in sorted(columns.items()):
-            to = _type_map.get(to, to)
-            if to != _type_map.get(from_, from_):
-                alterations.append((name, to))
+        alterations = ', '.join(
+            'MODIFY %s %s' % (name, _type_map.get(to, to))
+            for name, (from_, to) in sorted(columns.items())
+            if _type_map.get(to, to) != _type_map.get(from_, from_))
         if alterations:
-            yield "ALTER TABLE %s %s" % (table,
-                ', '.join("MODIFY %s %s" % each
-                          for each in alterations))
+            yield "ALTER TABLE %s %s" % (table, alterations)
 
     def backup(self, dest_file):
         db_url = self.env.config.get('trac', 'database')
@@ -261,18 +300,39 @@ class MySQLConnector(Component):
             elif name not in ('init_command', 'read_default_group'):
                 self.log.warning("Invalid connection string parameter '%s'",
                                  name)
-        args.extend(['-r', dest_file, db_name])
+        compress = dest_file.endswith('.gz')
+        if not compress:
+            # Use --result-file rather than stdout, which converts
+            # newlines on Windows.
+            args.extend(['-r', dest_file])
+        args.append(db_name)
 
         environ = os.environ.copy()
         if 'password' in db_prop:
             environ['MYSQL_PWD'] = str(db_prop['password'])
-        try:
-            p = Popen(args, env=environ, stderr=PIPE, close_fds=close_fds)
-        except OSError as e:
-            raise TracError(_("Unable to run %(path)s: %(msg)s",
-                              path=self.mysqldump_path,
-                              msg=exception_to_unicode(e)))
-        errmsg = p.communicate()[1]
+        # Collect stderr in a temporary file, so that the child can't
+        # block on a full pipe while the dump is streamed from stdout.
+        with TemporaryFile() as errors:
+            try:
+                p = Popen(args, env=environ, stdout=PIPE if compress else None,
+                          stderr=errors, close_fds=close_fds)
+            except OSError as e:
+                raise TracError(_("Unable to run %(path)s: %(msg)s",
+                                  path=self.mysqldump_path,
+                                  msg=exception_to_unicode(e)))
+            try:
+                if compress:
+                    with p.stdout, gzip.open(dest_file, 'wb') as f:
+                        shutil.copyfileobj(p.stdout, f)
+                p.wait()
+            finally:
+                if p.returncode is None:
+                    # the dump couldn't be written, don't leave mysqldump
+                    # running or unreaped
+                    p.kill()
+                    p.wait()
+            errors.seek(0)
+            errmsg = errors.read()
         if p.returncode != 0:
             raise TracError(_("mysqldump failed: %(msg)s",
                               msg=to_unicode(errmsg.strip())))
@@ -304,15 +364,27 @@ class MySQLConnector(Component):
     def _verify_table_status(self, db):
         from trac.db_default import schema
         tables = [t.name for t in schema]
+        unsupported = self.UNSUPPORTED_ENGINES
+        collations = ('utf8_bin', 'utf8mb4_bin')
         cursor = db.cursor()
-        cursor.execute("SHOW TABLE STATUS WHERE name IN (%s)" %
-                       ','.join(('%s',) * len(tables)),
-                       tables)
-        cols = get_column_names(cursor)
-        rows = [dict(zip(cols, row)) for row in cursor]
-
-        engines = [row['Name'] for row in rows
-                               if row['Engine'] in self.UNSUPPORTED_ENGINES]
+        cursor.execute("""
+            SELECT table_name, engine IN (%(engines)s),
+                   table_collation NOT IN (%(collations)s)
+            FROM information_schema.tables
+            WHERE table_schema=DATABASE() AND table_name IN (%(tables)s)
+            AND (engine IN (%(engines)s) OR
+                 table_collation NOT IN (%(collations)s))
+            """ % {'tables': _placeholders(len(tables)),
+                   'engines': _placeholders(len(unsupported)),
+                   'collations': _placeholders(len(collations))},
+            unsupported + collations + tuple(tables) + unsupported +
+            collations)
+        rows = cursor.fetchall()
+        engines = [name for name, bad_engine, bad_collation in rows
+                        if bad_engine]
+        non_utf8bin = [name for name, bad_engine, bad_collation in rows
+                            if bad_collation]
+
         if engines:
             raise TracError(_(
                 "All tables must be created as InnoDB or NDB storage engine "
@@ -320,9 +392,6 @@ class MySQLConnector(Component):
                 "created as storage engine which doesn't support "
                 "transactions: %(tables)s", tables=', '.join(engines)))
 
-        non_utf8bin = [row['Name'] for row in rows
-                       if row['Collation'] not in ('utf8_bin', 'utf8mb4_bin',
-                                                   None)]
         if non_utf8bin:
             raise TracError(_("All tables must be created with utf8_bin or "
                               "utf8mb4_bin as collation. The following tables "
@@ -335,30 +404,44 @@ class MySQLConnector(Component):
         ('utf8', 'utf8_bin'),
     )
 
-    def _verify_variables(self, db):
+    def _get_variables(self, db):
+        """Return the default storage engines for tables and temporary
+        tables, and the charset and collation of the database.
+        """
         cursor = db.cursor()
-        cursor.execute("SHOW VARIABLES WHERE variable_name IN ("
-                       "'default_storage_engine','storage_engine',"
-                       "'default_tmp_storage_engine',"
-                       "'character_set_database','collation_database')")
-        vars = {row[0].lower(): row[1] for row in cursor}
-
-        engine = vars.get('default_storage_engine') or \
-                 vars.get('storage_engine')
+        try:
+            cursor.execute("SELECT @@default_storage_engine,"
+                           "@@default_tmp_storage_engine,"
+                           "@@character_set_database,@@collation_database")
+        except pymysql.OperationalError:
+            # default_tmp_storage_engine is missing before MySQL 5.6
+            # and default_storage_engine before MySQL 5.5
+            cursor.execute("SHOW VARIABLES WHERE variable_name IN ("
+                           "'default_storage_engine','storage_engine',"
+                           "'default_tmp_storage_engine',"
+                           "'character_set_database','collation_database')")
+            vars = {row[0].lower(): row[1] for row in cursor}
+            return (vars.get('default_storage_engine') or
+                    vars.get('storage_engine'),
+                    vars.get('default_tmp_storage_engine'),
+                    vars['character_set_database'],
+                    vars['collation_database'])
+        else:
+            return cursor.fetchone()
+
+    def _verify_variables(self, db):
+        engine, tmp_engine, charset, collation = self._get_variables(db)
         if engine in self.UNSUPPORTED_ENGINES:
             raise TracError(_("The current storage engine is %(engine)s. "
                               "It must be InnoDB or NDB storage engine to "
                               "support transactions.", engine=engine))
 
-        tmp_engine = vars.get('default_tmp_storage_engine')
         if tmp_engine in self.UNSUPPORTED_ENGINES:
             raise TracError(_("The current storage engine for TEMPORARY "
                               "tables is %(engine)s. It must be InnoDB or NDB "
                               "storage engine to support transactions.",
                               engine=tmp_engine))
 
-        charset = vars['character_set_database']
-        collation = vars['collation_database']
         if (charset, collation) not in self.SUPPORTED_COLLATIONS:
             raise TracError(_(
                 "The charset and collation of database are '%(charset)s' and "
@@ -372,8 +455,10 @@ class MySQLConnection(ConnectionBase, ConnectionWrapper):
 
     poolable = True
 
+    _max_stmt_length = 16 * 1024 * 1024
+
     def __init__(self, path, log, user=None, password=None, host=None,
-                 port=None, params={}):
+                 port=None, params={}, multi_statements=False):
         if path.startswith('/'):
             path = path[1:]
         if password is None:
@@ -400,29 +485,57 @@ class MySQLConnection(ConnectionBase, ConnectionWrapper):
             else:
                 self.log.warning("Invalid connection string parameter '%s'",
                                  name)
+        if multi_statements:
+            opts['client_flag'] = pymysql.constants.CLIENT.MULTI_STATEMENTS
         cnx = pymysql.connect(db=path, user=user, passwd=password, host=host,
                               port=port, **opts)
         cursor = cnx.cursor()
-        cursor.execute("SHOW VARIABLES WHERE "
-                       " variable_name='character_set_database'")
-        charset = cursor.fetchone()[1]
+        cursor.execute("SELECT @@character_set_database,@@max_allowed_packet")
+        charset, max_allowed_packet = cursor.fetchone()
         if charset == 'utf8mb3':
             charset = 'utf8'
         self.charset = charset
+        self.max_allowed_packet = int(max_allowed_packet)
         cursor.close()
         if self.charset != opts['charset']:
-            cnx.close()
-            opts['charset'] = self.charset
-            cnx = pymysql.connect(db=path, user=user, passwd=password,
-                                  host=host, port=port, **opts)
+            # Switch the charset of the session rather than reconnecting
+            # (set_charset is deprecated since PyMySQL 1.1)
+            set_charset = getattr(cnx, 'set_character_set', None) or \
+                          cnx.set_charset
+            try:
+                set_charset(self.charset)
+            except pymysql.Error:
+                cnx.close()
+                opts['charset'] = self.charset
+                cnx = pymysql.connect(db=path, user=user, passwd=password,
+                                      host=host, port=port, **opts)
         self.schema = path
+        # the server may not allow multiple statements in a query
+        self.multi_statements = multi_statements and \
+            bool(cnx.server_capabilities &
+                 pymysql.constants.CLIENT.MULTI_STATEMENTS)
         ConnectionWrapper.__init__(self, cnx, log)
         self._is_closed = False
+        self._table_names = None
+        self._lower_table_names = None
+        self._column_names = {}
+        self._admin_cursor = None
 
     def cursor(self):
-        return IterableCursor(MySQLUnicodeCursor(self.cnx), self.log)
+        cursor = MySQLUnicodeCursor(self.cnx)
+        # Size the multi-row INSERTs of executemany after the largest
+        # packet the server accepts, keeping room for the packet header
+        # and bounding the memory used to build a statement.
+        cursor.max_stmt_length = min(self.max_allowed_packet - 1024,
+                                     self._max_stmt_length)
+        return IterableCursor(cursor, self.log)
+
+    def commit(self):
+        self._clear_schema_cache()
+        self.cnx.commit()
 
     def rollback(self):
+        self._clear_schema_cache()
         self.cnx.ping()
         try:
             self.cnx.rollback()
@@ -448,38 +561,45 @@ class MySQLConnection(ConnectionBase, ConnectionWrapper):
         return 'concat(%s)' % ', '.join(args)
 
     def drop_column(self, table, column):
-        cursor = pymysql.cursors.Cursor(self.cnx)
+        cursor = self._get_admin_cursor()
         if column in self.get_column_names(table):
             quoted_table = self.quote(table)
-            cursor.execute("SHOW INDEX FROM %s" % quoted_table)
-            columns = get_column_names(cursor)
-            keys = {}
-            for row in cursor.fetchall():
-                row = dict(zip(columns, row))
-                keys.setdefault(row['Key_name'], []).append(row['Column_name'])
             # drop all composite indices which in the given column is involved
-            for key, columns in keys.items():
-                if len(columns) > 1 and column in columns:
-                    if key == 'PRIMARY':
-                        cursor.execute("ALTER TABLE %s DROP PRIMARY KEY" %
-                                       quoted_table)
-                    else:
-                        cursor.execute("ALTER TABLE %s DROP KEY %s" %
-                                       (quoted_table, self.quote(key)))
+            cursor.execute("""
+                SELECT index_name FROM information_schema.statistics
+                WHERE table_schema=%s AND table_name=%s
+                GROUP BY index_name
+                HAVING COUNT(*) > 1 AND SUM(column_name=%s) > 0
+                """, (self.schema, table, column))
+            for key, in cursor.fetchall():
+                if key == 'PRIMARY':
+                    cursor.execute("ALTER TABLE %s DROP PRIMARY KEY" %
+                                   quoted_table)
+                else:
+                    cursor.execute("ALTER TABLE %s DROP KEY %s" %
+                                   (quoted_table, self.quote(key)))
             cursor.execute("ALTER TABLE %s DROP COLUMN %s " %
                            (quoted_table, self.quote(column)))
+            self._clear_schema_cache()
 
     def drop_table(self, table):
-        cursor = MySQLSilentCursor(self.cnx)
+        cursor = self._get_admin_cursor()
         cursor.execute("DROP TABLE IF EXISTS " + self.quote(table))
+        self._clear_schema_cache()
 
     def get_column_names(self, table):
-        rows = self.execute("""
-            SELECT column_name FROM information_schema.columns
-            WHERE table_schema=%s AND table_name=%s
-            ORDER BY ordinal_position
-            """, (self.schema, table))
-        return [row[0] for row in rows]
+        # table names are compared case-insensitively in information_schema
+        key = table.lower()
+        column_names = self._column_names.get(key)
+        if column_names is None:
+            rows = self._raw_execute("""
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema=%s AND table_name=%s
+                ORDER BY ordinal_position
+                """, (self.schema, table))
+            column_names = self._column_names[key] = \
+                           [row[0] for row in rows]
+        return list(column_names)
 
     def get_last_id(self, cursor, table, column='id'):
         return cursor.lastrowid
@@ -488,24 +608,30 @@ class MySQLConnection(ConnectionBase, ConnectionWrapper):
         return []
 
     def get_table_names(self):
-        rows = self.execute("""
-            SELECT table_name FROM information_schema.tables
-            WHERE table_schema=%s
-            """, (self.schema,))
-        return [row[0] for row in rows]
+        if self._table_names is None:
+            rows = self._raw_execute("""
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema=%s
+                """, (self.schema,))
+            self._table_names = [row[0] for row in rows]
+            self._lower_table_names = {name.lower()
+                                       for name in self._table_names}
+        return list(self._table_names)
 
     def has_table(self, table):
-        rows = self.execute("""
-            SELECT EXISTS (SELECT * FROM information_schema.columns
-                           WHERE table_schema=%s AND table_name=%s)
+        if self._table_names is not None:
+            return table.lower() in self._lower_table_names
+        rows = self._raw_execute("""
+            SELECT 1 FROM information_schema.tables
+            WHERE table_schema=%s AND table_name=%s LIMIT 1
             """, (self.schema, table))
-        return bool(rows[0][0])
+        return bool(rows)
 
     def like(self):
         return "LIKE %%s COLLATE %s_general_ci ESCAPE '/'" % self.charset
 
     def like_escape(self, text):
-        return _like_escape_re.sub(r'/\1', text)
+        return text.translate(_like_escape_table)
 
     def reset_tables(self):
         table_names = []
@@ -547,3 +673,28 @@ class MySQLConnection(ConnectionBase, ConnectionWrapper):
     def update_sequence(self, cursor, table, column='id'):
         # MySQL handles sequence updates automagically
         pass
+
+    def _get_admin_cursor(self):
+        """Return the cursor reused for the DDL statements of
+        `drop_column` and `drop_table`.
+
+        Like the connection itself, the cursor must not be shared between
+        threads.
+        """
+        if self._admin_cursor is None:
+            self._admin_cursor = MySQLSilentCursor(self.cnx)
+        return self._admin_cursor
+
+    def _raw_execute(self, sql, params):
+        """Execute an internal query on schema names, without the `Markup`
+        conversion and logging of the cursors returned by `cursor()`."""
+        with closing(pymysql.cursors.Cursor(self.cnx)) as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def _clear_schema_cache(self):
+        """Forget the cached table and column names, after a schema
+        change or at the end of a transaction."""
+        self._table_names = None
+        self._lower_table_names = None
+        self._column_names = {}
@@ -11,19 +11,22 @@
 # individuals. For the exact contribution history, see the revision
 # history and logs, available at https://trac.edgewall.org/.
 
+import csv
+
 from trac.admin.api import AdminCommandError, IAdminCommandProvider, \
                            IAdminPanelProvider, console_date_format, \
-                           console_datetime_format, get_console_locale
+                           console_datetime_format, get_console_locale, \
+                           get_dir_list
 from trac.core import *
-from trac.resource import ResourceNotFound
 from trac.ticket import model
 from trac.ticket.api import TicketSystem
 from trac.ticket.roadmap import (
     MilestoneModule, get_num_tickets_for_milestone, group_milestones)
-from trac.util import as_int, getuser
+from trac.util import as_int, file_or_std, getuser, lazy
 from trac.util.datefmt import format_date, format_datetime, \
                               get_datetime_format_hint, parse_date, user_time
-from trac.util.text import exception_to_unicode, print_table, printout
+from trac.util.text import exception_to_unicode, path_to_unicode, \
+                           print_table, printout
 from trac.util.translation import _, N_, gettext
 from trac.web.chrome import Chrome, add_ctxtnav, add_notice, add_script, \
                             add_warning
@@ -120,13 +123,10 @@ class ComponentAdminPanel(TicketAdminPanel):
                     sel = req.args.getlist('sel')
                     if not sel:
                         raise TracError(_("No component selected"))
-                    with self.env.db_transaction:
-                        for name in sel:
-                            model.Component(self.env, name).delete()
-                            if name == default:
-                                self.config.set('ticket',
-                                                'default_component', '')
-                                self._save_config(req)
+                    model.Component.delete_many(self.env, sel)
+                    if default in sel:
+                        self.config.set('ticket', 'default_component', '')
+                        self._save_config(req)
                     add_notice(req, _("The selected components have been "
                                       "removed."))
 
@@ -175,9 +175,18 @@ class ComponentAdminPanel(TicketAdminPanel):
         yield ('component chown', '<name> <owner>',
                "Change component owner",
                self._complete_chown, self._do_chown)
+        yield ('component import', '[file]',
+               """Import components from a file or stdin as CSV
+
+               Each row contains the name of a component and optionally
+               its owner. All the components are added in a single
+               transaction.
+               """,
+               self._complete_import, self._do_import)
 
     def get_component_list(self):
-        return [c.name for c in model.Component.select(self.env)]
+        return [name for name, in self.env.db_query("""
+                SELECT name FROM component ORDER BY name""")]
 
     def get_user_list(self):
         return TicketSystem(self.env).get_allowed_owners()
@@ -196,9 +205,13 @@ class ComponentAdminPanel(TicketAdminPanel):
         elif len(args) == 2:
             return self.get_user_list()
 
+    def _complete_import(self, args):
+        if len(args) == 1:
+            return get_dir_list(args[-1])
+
     def _do_list(self):
-        print_table([(c.name, c.owner)
-                     for c in model.Component.select(self.env)],
+        print_table(self.env.db_query("""
+                        SELECT name, owner FROM component ORDER BY name"""),
                     [_("Name"), _("Owner")])
 
     def _do_add(self, name, owner=None):
@@ -220,6 +233,34 @@ class ComponentAdminPanel(TicketAdminPanel):
         component.owner = owner
         component.update()
 
+    def _do_import(self, filename=None):
+        components = []
+        try:
+            with file_or_std(filename, 'r') as f:
+                reader = csv.reader(f)
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) > 2:
+                        raise AdminCommandError(
+                            _("Invalid row %(line)d. Expected <name>, "
+                              "[owner]", line=reader.line_num))
+                    component = model.Component(self.env)
+                    component.name = row[0]
+                    component.owner = row[1] if len(row) > 1 else None
+                    components.append(component)
+        except csv.Error as e:
+            raise AdminCommandError(
+                _("Cannot import from %(filename)s line %(line)d: %(error)s",
+                  filename=path_to_unicode(filename or 'stdin'),
+                  line=reader.line_num, error=e))
+        except IOError as e:
+            raise AdminCommandError(
+                _("Cannot import from %(filename)s: %(error)s",
+                  filename=path_to_unicode(filename or 'stdin'),
+                  error=e.strerror))
+        model.Component.insert_many(self.env, components)
+
 
 class MilestoneAdminPanel(TicketAdminPanel):
 
@@ -284,17 +325,15 @@ class MilestoneAdminPanel(TicketAdminPanel):
                 if 'add' in req.args and req.args.get('name'):
                     perm_cache.require('MILESTONE_CREATE')
                     name = req.args.get('name')
-                    try:
-                        model.Milestone(self.env, name=name)
-                    except ResourceNotFound:
+                    if name in model.MilestoneCache(self.env).milestones:
+                        add_warning(req, _('Milestone "%(name)s" already '
+                                           'exists, please choose another '
+                                           'name.', name=name))
+                    else:
                         milestone = model.Milestone(self.env)
                         milestone.name = name
                         MilestoneModule(self.env).save_milestone(req,
                                                                  milestone)
-                    else:
-                        add_warning(req, _('Milestone "%(name)s" already '
-                                           'exists, please choose another '
-                                           'name.', name=name))
 
                 # Remove milestone
                 elif 'remove' in req.args:
@@ -304,19 +343,17 @@ class MilestoneAdminPanel(TicketAdminPanel):
                     if not sel:
                         raise TracError(_("No milestone selected"))
                     with self.env.db_transaction:
-                        for name in sel:
-                            milestone = model.Milestone(self.env, name)
-                            milestone.move_tickets(None, req.authname,
-                                                   "Milestone deleted")
-                            milestone.delete()
-                            if name == ticket_default:
-                                self.config.set('ticket',
-                                                'default_milestone', '')
-                                save = True
-                            if name == retarget_default:
-                                self.config.set('milestone',
-                                                'default_retarget_to', '')
-                                save = True
+                        model.Milestone.move_tickets_many(
+                            self.env, sel, None, req.authname,
+                            "Milestone deleted")
+                        model.Milestone.delete_many(self.env, sel)
+                    if ticket_default in sel:
+                        self.config.set('ticket', 'default_milestone', '')
+                        save = True
+                    if retarget_default in sel:
+                        self.config.set('milestone', 'default_retarget_to',
+                                        '')
+                        save = True
                     if save:
                         self._save_config(req)
                     add_notice(req, _("The selected milestones have been "
@@ -353,19 +390,13 @@ class MilestoneAdminPanel(TicketAdminPanel):
 
                 req.redirect(req.href.admin(cat, page))
 
-            # Get ticket count
-            num_tickets = dict(self.env.db_query("""
-                    SELECT milestone, COUNT(milestone) FROM ticket
-                    WHERE milestone != ''
-                    GROUP BY milestone
-                """))
             query_href = lambda name: req.href.query([('group', 'status'),
                                                       ('milestone', name)])
 
             data = {'view': 'list',
-                    'milestones': model.Milestone.select(self.env),
+                    'milestones':
+                        model.Milestone.select_with_num_tickets(self.env),
                     'query_href': query_href,
-                    'num_tickets': lambda m: num_tickets.get(m.name, 0),
                     'ticket_default': ticket_default,
                     'retarget_default': retarget_default}
 
@@ -448,12 +479,14 @@ class MilestoneAdminPanel(TicketAdminPanel):
     def _do_add(self, name, due=None, started=None):
         milestone = model.Milestone(self.env)
         milestone.name = name
-        if started is not None:
-            milestone.started = parse_date(started, hint='datetime',
-                                       locale=get_console_locale(self.env))
-        if due is not None:
-            milestone.due = parse_date(due, hint='datetime',
-                                       locale=get_console_locale(self.env))
+        if started is not None or due is not None:
+            locale = get_console_locale(self.env)
+            if started is not None:
+                milestone.started = parse_date(started, hint='datetime',
+                                               locale=locale)
+            if due is not None:
+                milestone.due = parse_date(due, hint='datetime',
+                                           locale=locale)
         milestone.insert()
 
     def _do_rename(self, name, newname):
@@ -530,13 +563,10 @@ class VersionAdminPanel(TicketAdminPanel):
                     sel = req.args.getlist('sel')
                     if not sel:
                         raise TracError(_("No version selected"))
-                    with self.env.db_transaction:
-                        for name in sel:
-                            model.Version(self.env, name).delete()
-                            if name == default:
-                                self.config.set('ticket',
-                                                'default_version', '')
-                                self._save_config(req)
+                    model.Version.delete_many(self.env, sel)
+                    if default in sel:
+                        self.config.set('ticket', 'default_version', '')
+                        self._save_config(req)
                     add_notice(req, _("The selected versions have been "
                                       "removed."))
 
@@ -691,10 +721,10 @@ class AbstractEnumAdminPanel(TicketAdminPanel):
                     with self.env.db_transaction:
                         for name in sel:
                             self._enum_cls(self.env, name).delete()
-                            if name == default:
-                                self.config.set('ticket',
-                                                'default_%s' % self._type, '')
-                                self.config.save()
+                    if default in sel:
+                        self.config.set('ticket', 'default_%s' % self._type,
+                                        '')
+                        self.config.save()
                     add_notice(req, _("The selected %(field)s values have "
                                       "been removed.", field=label[0]))
 
@@ -710,20 +740,24 @@ class AbstractEnumAdminPanel(TicketAdminPanel):
                         self._save_config(req)
 
                     # Change enum values
-                    order = {str(int(key[6:])): str(req.args.getint(key))
-                             for key in req.args
-                             if key.startswith('value_')}
-                    values = {val: True for val in order.values()}
-                    if len(order) != len(values):
-                        raise TracError(_("Order numbers must be unique"))
-                    changed = False
+                    order = {}
+                    values = set()
+                    for key in req.args:
+                        if key.startswith('value_'):
+                            value = str(req.args.getint(key))
+                            if value in values:
+                                raise TracError(
+                                    _("Order numbers must be unique"))
+                            values.add(value)
+                            order[str(int(key[6:]))] = value
+                    changed = []
                     with self.env.db_transaction:
                         for enum in self._enum_cls.select(self.env):
                             new_value = order[enum.value]
                             if new_value != enum.value:
                                 enum.value = new_value
-                                enum.update()
-                                changed = True
+                                changed.append(enum)
+                        self._enum_cls.update_values(self.env, changed)
 
                     if changed:
                         add_notice(req, _("Your changes have been saved."))
@@ -754,26 +788,33 @@ class AbstractEnumAdminPanel(TicketAdminPanel):
     }
 
     def get_admin_commands(self):
+        return self._admin_commands
+
+    @lazy
+    def _admin_commands(self):
+        """The command tuples, built once as the labels never change."""
         enum_type = getattr(self, '_command_type', self._type)
         label = tuple(each.lower() for each in self._label)
-        yield ('%s list' % enum_type, '',
-               self._command_help['list'] % label[1],
-               None, self._do_list)
-        yield ('%s add' % enum_type, '<value>',
-               self._command_help['add'] % label[0],
-               None, self._do_add)
-        yield ('%s change' % enum_type, '<value> <newvalue>',
-               self._command_help['change'] % label[0],
-               self._complete_change_remove, self._do_change)
-        yield ('%s remove' % enum_type, '<value>',
-               self._command_help['remove'] % label[0],
-               self._complete_change_remove, self._do_remove)
-        yield ('%s order' % enum_type, '<value> up|down',
-               self._command_help['order'] % label[0],
-               self._complete_order, self._do_order)
+        return [
+            ('%s list' % enum_type, '',
+             self._command_help['list'] % label[1],
+             None, self._do_list),
+            ('%s add' % enum_type, '<value>',
+             self._command_help['add'] % label[0],
+             None, self._do_add),
+            ('%s change' % enum_type, '<value> <newvalue>',
+             self._command_help['change'] % label[0],
+             self._complete_change_remove, self._do_change),
+            ('%s remove' % enum_type, '<value>',
+             self._command_help['remove'] % label[0],
+             self._complete_change_remove, self._do_remove),
+            ('%s order' % enum_type, '<value> up|down',
+             self._command_help['order'] % label[0],
+             self._complete_order, self._do_order),
+        ]
 
     def get_enum_list(self):
-        return [e.name for e in self._enum_cls.select(self.env)]
+        return self._enum_cls.select_names(self.env)
 
     def _complete_change_remove(self, args):
         if len(args) == 1:
@@ -786,7 +827,7 @@ class AbstractEnumAdminPanel(TicketAdminPanel):
             return ['up', 'down']
 
     def _do_list(self):
-        print_table([(e.name,) for e in self._enum_cls.select(self.env)],
+        print_table([(name,) for name in self.get_enum_list()],
                     [_("Possible Values")])
 
     def _do_add(self, name):
@@ -807,17 +848,14 @@ class AbstractEnumAdminPanel(TicketAdminPanel):
             raise AdminCommandError(_("Invalid up/down value: %(value)s",
                                       value=up_down))
         direction = -1 if up_down == 'up' else 1
-        enum1 = self._enum_cls(self.env, name)
-        enum1.value = int(float(enum1.value) + direction)
-        for enum2 in self._enum_cls.select(self.env):
-            if int(float(enum2.value)) == enum1.value:
-                enum2.value = int(float(enum2.value) - direction)
-                break
-        else:
-            return
         with self.env.db_transaction:
-            enum1.update()
-            enum2.update()
+            enum1 = self._enum_cls(self.env, name)
+            enum1.value = int(float(enum1.value) + direction)
+            enum2 = self._enum_cls.select_by_value(self.env, enum1.value)
+            if enum2 is None:
+                return
+            enum2.value = enum1.value - direction
+            self._enum_cls.update_values(self.env, [enum1, enum2])
 
 
 class PriorityAdminPanel(AbstractEnumAdminPanel):
@@ -861,19 +899,24 @@ class TicketAdmin(Component):
     # IAdminCommandProvider methods
 
     def get_admin_commands(self):
-        yield ('ticket remove', '<ticket#>',
-               'Remove ticket', None, self._do_remove)
+        yield ('ticket remove', '<ticket#> [ticket#] [...]',
+               """Remove tickets
+
+               All the given tickets are removed in a single transaction.
+               """, None, self._do_remove)
         yield ('ticket remove_comment', '<ticket#> <comment#>',
                'Remove ticket comment', None, self._do_remove_comment)
 
-    def _do_remove(self, number):
-        number = as_int(number, None)
-        if number is None:
+    def _do_remove(self, number, *numbers):
+        numbers = [as_int(number, None) for number in (number,) + numbers]
+        if None in numbers:
             raise AdminCommandError(_("<ticket#> must be a number"))
         with self.env.db_transaction:
-            model.Ticket(self.env, number).delete()
-        printout(_("Ticket #%(num)s and all associated data removed.",
-                   num=number))
+            for number in numbers:
+                model.Ticket(self.env, number).delete()
+        for number in numbers:
+            printout(_("Ticket #%(num)s and all associated data removed.",
+                       num=number))
 
     def _do_remove_comment(self, ticket_number, comment_number):
         ticket_number = as_int(ticket_number, None)
@@ -888,6 +931,6 @@ class TicketAdmin(Component):
             if not change:
                 raise AdminCommandError(_("Comment %(num)s not found",
                                           num=comment_number))
-            ticket.delete_change(comment_number)
+            ticket.delete_change(cdate=change['date'])
         printout(_("The ticket comment %(num)s on ticket #%(id)s has been "
                    "deleted.", num=comment_number, id=ticket_number))
@@ -739,10 +739,34 @@ class Ticket(object):
             return ts, author, comment
 
 
+class EnumCache(core.Component):
+    """Cache for the rows of the enum table."""
+
+    @cached
+    def enums(self):
+        """Dictionary containing the enum rows, indexed by type.
+
+        The rows of each type are `(name, value, description)` tuples
+        ordered by value.
+        """
+        enums = {}
+        with self.env.db_query as db:
+            for type_, name, value, description in db("""
+                    SELECT type, name, value, description FROM enum
+                    ORDER BY type, %s
+                    """ % db.cast('value', 'int')):
+                enums.setdefault(type_, []).append((name, value,
+                                                    description))
+        return enums
+
+
 class AbstractEnum(object):
     type = None
     ticket_col = None
     label = None
+    # `update_values` stores the values with a single statement, unless
+    # `update` is overridden or this is `False`
+    batch_update_values = True
 
     exists = property(lambda self: self._old_value is not None)
 
@@ -761,14 +785,13 @@ class AbstractEnum(object):
         self.value = self._old_value = None
         self.description = None
         if name:
-            for value, description in self.env.db_query("""
-                    SELECT value, description FROM enum
-                    WHERE type=%s AND name=%s
-                    """, (self.type, name)):
-                self.value = self._old_value = value
-                self.description = _null_to_empty(description)
-                self.name = self._old_name = name
-                break
+            for name_, value, description in \
+                    EnumCache(env).enums.get(self.type, ()):
+                if name_ == name:
+                    self.value = self._old_value = value
+                    self.description = _null_to_empty(description)
+                    self.name = self._old_name = name
+                    break
             else:
                 raise ResourceNotFound(_("%(type)s %(name)s does not exist.",
                                          type=gettext(self.label[0]),
@@ -790,6 +813,7 @@ class AbstractEnum(object):
         with self.env.db_transaction as db:
             db("DELETE FROM enum WHERE type=%s AND value=%s",
                (self.type, self._old_value))
+            del EnumCache(self.env).enums
             # Re-order any enums that have higher value than deleted
             # (close gap)
             for enum in self.select(self.env):
@@ -833,6 +857,7 @@ class AbstractEnum(object):
                 raise ResourceExistsError(
                     _('%(type)s value "%(name)s" already exists',
                       type=gettext(self.label[0]), name=self.name))
+            del EnumCache(self.env).enums
             TicketSystem(self.env).reset_ticket_fields()
         self._old_name = self.name
         self._old_value = self.value
@@ -859,6 +884,7 @@ class AbstractEnum(object):
                 raise ResourceExistsError(
                     _('%(type)s value "%(name)s" already exists',
                       type=gettext(self.label[0]), name=self.name))
+            del EnumCache(self.env).enums
             self._old_value = self.value
             if self.name != self._old_name:
                 # Update tickets
@@ -868,19 +894,91 @@ class AbstractEnum(object):
                 self._old_name = self.name
                 TicketSystem(self.env).reset_ticket_fields()
 
+    @classmethod
+    def update_values(cls, env, enums):
+        """Store the changed `value` of the given existing `enums` with
+        a single `UPDATE` statement.
+
+        The enums are updated one by one with `update` if their class
+        overrides `update`, or if `batch_update_values` is `False`.
+
+        :raises TracError: if an enum does not exist or its name is empty.
+        :raises ResourceNotFound: if an enum has been deleted or renamed
+                                  in the meantime.
+        """
+        enums = list(enums)
+        if not enums:
+            return
+        if not cls.batch_update_values or \
+                any(type(enum).update is not AbstractEnum.update
+                    for enum in enums):
+            with env.db_transaction:
+                for enum in enums:
+                    enum.update()
+            return
+        for enum in enums:
+            if not enum.exists:
+                raise TracError(_("Cannot update non-existent enum."))
+            enum._check_and_coerce_fields()
+        env.log.info("Updating values of %s %s", cls.type,
+                     ', '.join(enum.name for enum in enums))
+        names = [enum._old_name for enum in enums]
+        args = []
+        for enum in enums:
+            args.extend((enum._old_name, str(enum.value)))
+        args.append(cls.type)
+        args.extend(names)
+        holders = ','.join(['%s'] * len(enums))
+        with env.db_transaction as db:
+            found = {name for name, in db("""
+                SELECT name FROM enum WHERE type=%%s AND name IN (%s)
+                """ % holders, [cls.type] + names)}
+            for name in names:
+                if name not in found:
+                    raise ResourceNotFound(
+                        _("%(type)s %(name)s does not exist.",
+                          type=gettext(cls.label[0]), name=name))
+            db("""
+                UPDATE enum SET value=CASE name %s END
+                WHERE type=%%s AND name IN (%s)
+                """ % (' '.join(['WHEN %s THEN %s'] * len(enums)), holders),
+               args)
+            del EnumCache(env).enums
+        for enum in enums:
+            enum._old_value = enum.value
+
     @classmethod
     def select(cls, env):
-        with env.db_query as db:
-            for name, value, description in db("""
-                    SELECT name, value, description FROM enum
-                    WHERE type=%s ORDER BY
-                    """ + db.cast('value', 'int'),
-                    (cls.type,)):
-                obj = cls(env)
-                obj.name = obj._old_name = name
-                obj.value = obj._old_value = value
-                obj.description = _null_to_empty(description)
-                yield obj
+        for name, value, description in \
+                EnumCache(env).enums.get(cls.type, ()):
+            obj = cls(env)
+            obj.name = obj._old_name = name
+            obj.value = obj._old_value = value
+            obj.description = _null_to_empty(description)
+            yield obj
+
+    @classmethod
+    def select_names(cls, env):
+        """Return the list of enum names, ordered by value."""
+        return [row[0] for row in EnumCache(env).enums.get(cls.type, ())]
+
+    @classmethod
+    def select_by_value(cls, env, value):
+        """Return the enum having the given integer `value`, or `None`
+        if there's no such enum.
+        """
+        for name, enum_value, description in \
+                EnumCache(env).enums.get(cls.type, ()):
+            try:
+                if int(float(enum_value)) != value:
+                    continue
+            except ValueError:
+                continue
+            obj = cls(env)
+            obj.name = obj._old_name = name
+            obj.value = obj._old_value = enum_value
+            obj.description = _null_to_empty(description)
+            return obj
 
     def _check_and_coerce_fields(self):
         self.name = simplify_whitespace(self.name)
@@ -974,6 +1072,29 @@ class Component(object):
             TicketSystem(self.env).reset_ticket_fields()
         self.name = self._old_name = None
 
+    @classmethod
+    def delete_many(cls, env, names):
+        """Delete the components with the given `names` in a single
+        statement.
+
+        :raises ResourceNotFound: if one of the components does not exist.
+        """
+        names = list(names)
+        if not names:
+            return
+        holders = ','.join(['%s'] * len(names))
+        with env.db_transaction as db:
+            found = {name for name, in db("""
+                SELECT name FROM component WHERE name IN (%s)
+                """ % holders, names)}
+            for name in names:
+                if name not in found:
+                    raise ResourceNotFound(
+                        _("Component %(name)s does not exist.", name=name))
+            env.log.info("Deleting components %s", ', '.join(names))
+            db("DELETE FROM component WHERE name IN (%s)" % holders, names)
+            TicketSystem(env).reset_ticket_fields()
+
     def insert(self):
         """Insert a new component.
 
@@ -999,6 +1120,48 @@ class Component(object):
             TicketSystem(self.env).reset_ticket_fields()
         self._old_name = self.name
 
+    @classmethod
+    def insert_many(cls, env, components):
+        """Insert the given new `components` in a single transaction.
+
+        :raises TracError: if a component name is empty.
+        :raises ResourceExistsError: if a component with one of the names
+                                     already exists.
+        """
+        components = list(components)
+        if not components:
+            return
+        names = set()
+        for component in components:
+            if component.exists:
+                raise ResourceExistsError(
+                    _('Component "%(name)s" already exists.',
+                      name=component.name))
+            component._check_and_coerce_fields()
+            if component.name in names:
+                raise ResourceExistsError(
+                    _('Component "%(name)s" already exists.',
+                      name=component.name))
+            names.add(component.name)
+
+        env.log.debug("Creating new components %s",
+                      ', '.join(c.name for c in components))
+        with env.db_transaction as db:
+            for name, in db("""
+                    SELECT name FROM component WHERE name IN (%s)
+                    """ % ','.join(['%s'] * len(components)),
+                    [c.name for c in components]):
+                raise ResourceExistsError(
+                    _('Component "%(name)s" already exists.', name=name))
+            db.executemany("""
+                INSERT INTO component (name,owner,description)
+                VALUES (%s,%s,%s)
+                """, [(c.name, _to_null(c.owner), _to_null(c.description))
+                      for c in components])
+            TicketSystem(env).reset_ticket_fields()
+        for component in components:
+            component._old_name = component.name
+
     def update(self):
         """Update the component.
 
@@ -1163,6 +1326,41 @@ class Milestone(object):
         for listener in TicketSystem(self.env).milestone_change_listeners:
             listener.milestone_deleted(self)
 
+    @classmethod
+    def delete_many(cls, env, names):
+        """Delete the milestones with the given `names` in a single
+        statement.
+
+        Like `delete`, the tickets associated with the milestones are
+        left untouched and should be moved beforehand.
+
+        :raises ResourceNotFound: if one of the milestones does not exist.
+        """
+        names = list(names)
+        if not names:
+            return
+        with env.db_transaction as db:
+            milestones = cls.select_by_names(env, names)
+            found = {m.name for m in milestones}
+            for name in names:
+                if name not in found:
+                    raise ResourceNotFound(
+                        _("Milestone %(name)s does not exist.", name=name))
+            env.log.info("Deleting milestones %s", ', '.join(names))
+            db("DELETE FROM milestone WHERE name IN (%s)"
+               % ','.join(['%s'] * len(names)), names)
+            for name in names:
+                Attachment.delete_all(env, cls.realm, name)
+            del MilestoneCache(env).milestones
+            TicketSystem(env).reset_ticket_fields()
+        for milestone in milestones:
+            milestone._old['name'] = None
+
+        listeners = TicketSystem(env).milestone_change_listeners
+        for milestone in milestones:
+            for listener in listeners:
+                listener.milestone_deleted(milestone)
+
     def insert(self):
         """Insert a new milestone.
 
@@ -1251,18 +1449,46 @@ class Milestone(object):
                 raise ResourceNotFound(
                     _("Milestone %(name)s does not exist.",
                       name=new_milestone), _("Invalid milestone name."))
+        return self._move_tickets(self.env, [self._old['name']],
+                                  new_milestone, author, comment,
+                                  exclude_closed)
+
+    @classmethod
+    def move_tickets_many(cls, env, names, new_milestone, author,
+                          comment=None, exclude_closed=False):
+        """Move tickets associated with any of the milestones `names` to
+        another milestone, retrieving the tickets with a single query.
+
+        The parameters and the return value are the same as for
+        `move_tickets`.
+        """
+        if new_milestone and not MilestoneCache(env).fetchone(new_milestone):
+            raise ResourceNotFound(
+                _("Milestone %(name)s does not exist.",
+                  name=new_milestone), _("Invalid milestone name."))
+        return cls._move_tickets(env, list(names), new_milestone, author,
+                                 comment, exclude_closed)
+
+    @classmethod
+    def _move_tickets(cls, env, names, new_milestone, author, comment,
+                      exclude_closed):
+        if not names:
+            return []
         now = datetime_now(utc)
-        sql = "SELECT id FROM ticket WHERE milestone=%s"
+        sql = "SELECT id FROM ticket WHERE milestone IN (%s)" \
+              % ','.join(['%s'] * len(names))
         if exclude_closed:
             sql += " AND status != 'closed'"
-        with self.env.db_transaction as db:
-            tkt_ids = [int(row[0]) for row in db(sql, (self._old['name'],))]
+        with env.db_transaction as db:
+            tkt_ids = [int(row[0]) for row in db(sql, names)]
             if tkt_ids:
-                self.env.log.info("Moving tickets associated with milestone "
-                                  "'%s' to milestone '%s'", self._old['name'],
-                                  new_milestone)
+                env.log.info("Moving tickets associated with milestone "
+                             "'%s' to milestone '%s'", "', '".join(names),
+                             new_milestone)
+                # Save each ticket, so that the change listeners are
+                # notified
                 for tkt_id in tkt_ids:
-                    ticket = Ticket(self.env, tkt_id)
+                    ticket = Ticket(env, tkt_id)
                     ticket['milestone'] = new_milestone
                     ticket.save_changes(author, comment, now)
         return tkt_ids
@@ -1272,11 +1498,52 @@ class Milestone(object):
         milestones = MilestoneCache(env).fetchall()
         if not include_completed:
             milestones = [m for m in milestones if m.completed is None]
-        def milestone_order(m):
-            return (m.completed or utcmax,
-                    m.due or utcmax,
-                    embedded_numbers(m.name))
-        return sorted(milestones, key=milestone_order)
+        return sorted(milestones, key=cls._order)
+
+    @classmethod
+    def select_by_names(cls, env, names):
+        """Return the milestones with the given `names`, in that order.
+        Names of non-existent milestones are ignored.
+
+        The milestones are all looked up in the `MilestoneCache`, which
+        is loaded with a single query if needed.
+        """
+        cache = MilestoneCache(env)
+        return [m for m in (cache.fetchone(name) for name in names) if m]
+
+    @classmethod
+    def select_with_num_tickets(cls, env):
+        """Return all milestones, sorted as by `select`, with the number
+        of tickets associated to each one set as `num_tickets` attribute.
+
+        The milestones and their ticket counts are fetched with a single
+        query.
+        """
+        cache = MilestoneCache(env)
+        milestones = []
+        for name, due, started, completed, description, num_tickets \
+                in env.db_query("""
+                SELECT m.name, m.due, m.started, m.completed, m.description,
+                       COALESCE(t.num, 0)
+                FROM milestone AS m
+                LEFT OUTER JOIN (
+                    SELECT milestone, COUNT(*) AS num FROM ticket
+                    WHERE milestone != '' GROUP BY milestone) AS t
+                  ON t.milestone=m.name
+                """):
+            milestone = cache.factory((name, _from_timestamp(due),
+                                       _from_timestamp(started),
+                                       _from_timestamp(completed),
+                                       description or ''))
+            milestone.num_tickets = num_tickets
+            milestones.append(milestone)
+        return sorted(milestones, key=cls._order)
+
+    @staticmethod
+    def _order(m):
+        return (m.completed or utcmax,
+                m.due or utcmax,
+                embedded_numbers(m.name))
 
 
 class Report(object):
@@ -1402,6 +1669,29 @@ class Version(object):
             TicketSystem(self.env).reset_ticket_fields()
         self.name = self._old_name = None
 
+    @classmethod
+    def delete_many(cls, env, names):
+        """Delete the versions with the given `names` in a single
+        statement.
+
+        :raises ResourceNotFound: if one of the versions does not exist.
+        """
+        names = list(names)
+        if not names:
+            return
+        holders = ','.join(['%s'] * len(names))
+        with env.db_transaction as db:
+            found = {name for name, in db("""
+                SELECT name FROM version WHERE name IN (%s)
+                """ % holders, names)}
+            for name in names:
+                if name not in found:
+                    raise ResourceNotFound(
+                        _("Version %(name)s does not exist.", name=name))
+            env.log.info("Deleting versions %s", ', '.join(names))
+            db("DELETE FROM version WHERE name IN (%s)" % holders, names)
+            TicketSystem(env).reset_ticket_fields()
+
     def insert(self):
         """Insert a new version.
 
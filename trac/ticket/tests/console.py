@@ -140,6 +140,33 @@ class TracAdminTestCase(TracAdminTestCaseBase):
         self.assertEqual(2, rv, output)
         self.assertExpectedResult(output)
 
+    def test_component_import_ok(self):
+        """
+        Tests the 'component import' command in trac-admin.  This particular
+        test imports components from stdin and checks for success.
+        """
+        rv, output = self.execute('component import',
+                                  input='new_component1,new_user\n'
+                                        'new_component2\n')
+        self.assertEqual(0, rv, output)
+        self.assertEqual('', output)
+        rv, output = self.execute('component list')
+        self.assertEqual(0, rv, output)
+        self.assertExpectedResult(output)
+
+    def test_component_import_error_already_exists(self):
+        """
+        Tests the 'component import' command in trac-admin.  This particular
+        test imports a component name that already exists and checks that
+        no component is added.
+        """
+        rv, output = self.execute('component import',
+                                  input='new_component\ncomponent1\n')
+        self.assertEqual(2, rv, output)
+        self.assertExpectedResult(output)
+        self.assertNotIn('new_component',
+                         self.execute('component list')[1])
+
     def test_component_chown_ok(self):
         """
         Tests the 'component chown' command in trac-admin.  This particular
@@ -223,6 +250,23 @@ class TracAdminTestCase(TracAdminTestCaseBase):
         self.assertEqual(0, rv, output)
         self.assertExpectedResult(output)
 
+    def test_ticket_remove_many_ok(self):
+        """Several tickets are deleted at once."""
+        insert_ticket(self.env)
+        insert_ticket(self.env)
+        rv, output = self.execute('ticket remove 1 2')
+        self.assertEqual(0, rv, output)
+        self.assertExpectedResult(output)
+        self.assertEqual([], self.env.db_query("SELECT id FROM ticket"))
+
+    def test_ticket_remove_many_error_invalid_ticket_id(self):
+        """No ticket is deleted when one of the tickets does not exist."""
+        insert_ticket(self.env)
+        rv, output = self.execute('ticket remove 1 2')
+        self.assertEqual(2, rv, output)
+        self.assertExpectedResult(output)
+        self.assertEqual([(1,)], self.env.db_query("SELECT id FROM ticket"))
+
     def test_ticket_remove_error_no_ticket_argument(self):
         """Error reported when ticket# argument is missing."""
         rv, output = self.execute('ticket remove')
@@ -1016,6 +1016,61 @@ class EnumTestCase(unittest.TestCase):
         self.assertTrue(Priority(self.env, 'foo').exists)
         self.assertRaises(TracError, Priority, self.env, 'major')
 
+    def test_priority_select_names(self):
+        self.assertEqual([p.name for p in Priority.select(self.env)],
+                         Priority.select_names(self.env))
+
+    def test_priority_select_by_value(self):
+        priority = Priority.select_by_value(self.env, 3)
+        self.assertEqual('major', priority.name)
+        self.assertEqual('3', priority.value)
+        self.assertTrue(priority.exists)
+        self.assertIsNone(Priority.select_by_value(self.env, 100))
+
+    def test_priority_update_values(self):
+        major = Priority(self.env, 'major')
+        minor = Priority(self.env, 'minor')
+        major.value, minor.value = minor.value, major.value
+        Priority.update_values(self.env, [major, minor])
+        self.assertEqual('4', Priority(self.env, 'major').value)
+        self.assertEqual('3', Priority(self.env, 'minor').value)
+        self.assertEqual('4', major._old_value)
+        self.assertEqual(['blocker', 'critical', 'minor', 'major', 'trivial'],
+                         Priority.select_names(self.env))
+
+    def test_priority_update_values_overridden_update(self):
+        updated = []
+        class MyPriority(Priority):
+            def update(self):
+                updated.append(self.name)
+                super().update()
+        major = MyPriority(self.env, 'major')
+        minor = MyPriority(self.env, 'minor')
+        major.value, minor.value = minor.value, major.value
+        MyPriority.update_values(self.env, [major, minor])
+        self.assertEqual(['major', 'minor'], updated)
+        self.assertEqual('4', Priority(self.env, 'major').value)
+        self.assertEqual('3', Priority(self.env, 'minor').value)
+
+    def test_priority_update_values_deleted(self):
+        major = Priority(self.env, 'major')
+        minor = Priority(self.env, 'minor')
+        self.env.db_transaction("""
+            DELETE FROM enum WHERE type='priority' AND name='minor'""")
+        major.value, minor.value = minor.value, major.value
+        with self.assertRaises(ResourceNotFound) as cm:
+            Priority.update_values(self.env, [major, minor])
+        self.assertEqual("Priority minor does not exist.",
+                         str(cm.exception))
+        self.assertEqual('3', Priority(self.env, 'major').value)
+
+    def test_priority_update_values_non_existent(self):
+        priority = Priority(self.env)
+        priority.name = 'foo'
+        priority.value = '10'
+        self.assertRaises(TracError, Priority.update_values, self.env,
+                          [priority])
+
     def test_priority_update_empty_description_stored_as_null(self):
         """Empty description is stored as NULL."""
         priority = Priority(self.env)
@@ -1210,6 +1265,31 @@ class MilestoneTestCase(unittest.TestCase):
         self.assertNotEqual(self.updated_at, tkt1['changetime'])
         self.assertEqual(self.updated_at, tkt2['changetime'])
 
+    def test_move_tickets_many(self):
+        self.env.db_transaction.executemany(
+            "INSERT INTO milestone (name) VALUES (%s)",
+            [('Test1',), ('Test2',), ('Testing',)])
+        tkt1 = self._insert_ticket(status='new', summary='Foo',
+                                   milestone='Test1')
+        tkt2 = self._insert_ticket(status='new', summary='Bar',
+                                   milestone='Test2')
+        tkt3 = self._insert_ticket(status='new', summary='Baz',
+                                   milestone='Testing')
+        ids = Milestone.move_tickets_many(self.env, ['Test1', 'Test2'],
+                                          'Testing', 'anonymous',
+                                          'Move tickets')
+
+        self.assertEqual({tkt1.id, tkt2.id}, set(ids))
+        tkt1 = Ticket(self.env, tkt1.id)
+        tkt2 = Ticket(self.env, tkt2.id)
+        tkt3 = Ticket(self.env, tkt3.id)
+        self.assertEqual('Testing', tkt1['milestone'])
+        self.assertEqual('Testing', tkt2['milestone'])
+        self.assertEqual(tkt1['changetime'], tkt2['changetime'])
+        self.assertEqual(self.created_at, tkt3['changetime'])
+        self.assertRaises(ResourceNotFound, Milestone.move_tickets_many,
+                          self.env, ['Testing'], 'Test3', 'anonymous')
+
     def test_move_tickets_target_doesnt_exist(self):
         self.env.db_transaction("INSERT INTO milestone (name) VALUES ('Test')")
         tkt1 = self._insert_ticket(status='new', summary='Foo',
@@ -1288,6 +1368,35 @@ class MilestoneTestCase(unittest.TestCase):
         self.assertEqual(tkt1['changetime'], tkt2['changetime'])
         self.assertNotEqual(self.updated_at, tkt1['changetime'])
 
+    def test_delete_many_milestones(self):
+        ts = TicketSystem(self.env)
+        listener = ts.milestone_change_listeners[0]
+        attachment = Attachment(self.env, 'milestone', 'milestone1')
+        attachment.insert('foo.txt', io.BytesIO(), 0, 1)
+
+        Milestone.delete_many(self.env, ['milestone1', 'milestone2'])
+
+        self.assertEqual([('milestone3',), ('milestone4',)],
+                         self.env.db_query("SELECT name FROM milestone "
+                                           "ORDER BY name"))
+        self.assertEqual(['milestone3', 'milestone4'],
+                         sorted(m.name for m in Milestone.select(self.env)))
+        attachments = Attachment.select(self.env, 'milestone', 'milestone1')
+        self.assertRaises(StopIteration, next, attachments)
+        self.assertEqual('deleted', listener.action)
+        self.assertEqual('milestone2', listener.milestone.name)
+        self.assertFalse(listener.milestone.exists)
+
+    def test_delete_many_milestones_deleted_concurrently(self):
+        milestones = ['milestone1', 'milestone2']
+        Milestone(self.env, 'milestone2').delete()
+
+        with self.assertRaises(ResourceNotFound) as cm:
+            Milestone.delete_many(self.env, milestones)
+        self.assertEqual("Milestone milestone2 does not exist.",
+                         str(cm.exception))
+        self.assertTrue(Milestone(self.env, 'milestone1').exists)
+
     def test_update_milestone(self):
         self.env.db_transaction("INSERT INTO milestone (name) VALUES ('Test')")
 
@@ -1362,6 +1471,34 @@ class MilestoneTestCase(unittest.TestCase):
         self.assertEqual('2.0', milestones[1].name)
         self.assertTrue(milestones[1].exists)
 
+    def test_select_milestones_by_names(self):
+        self.env.db_transaction.executemany(
+            "INSERT INTO milestone (name) VALUES (%s)",
+            [('1.0',), ('2.0',)])
+
+        milestones = Milestone.select_by_names(self.env,
+                                               ['2.0', '3.0', '1.0'])
+        self.assertEqual(['2.0', '1.0'], [m.name for m in milestones])
+        self.assertTrue(all(m.exists for m in milestones))
+        self.assertEqual([], Milestone.select_by_names(self.env, []))
+
+    def test_select_milestones_with_num_tickets(self):
+        self.env.db_transaction.executemany(
+            "INSERT INTO milestone (name) VALUES (%s)",
+            [('1.0',), ('2.0',)])
+        insert_ticket(self.env, summary='Ticket 1', milestone='1.0')
+        insert_ticket(self.env, summary='Ticket 2', milestone='1.0')
+        insert_ticket(self.env, summary='Ticket 3', milestone='3.0')
+
+        milestones = Milestone.select_with_num_tickets(self.env)
+        self.assertEqual([m.name for m in Milestone.select(self.env)],
+                         [m.name for m in milestones])
+        self.assertEqual(('1.0', 2), (milestones[0].name,
+                                      milestones[0].num_tickets))
+        self.assertEqual(('2.0', 0), (milestones[1].name,
+                                      milestones[1].num_tickets))
+        self.assertTrue(milestones[0].exists)
+
     def test_change_listener_created(self):
         ts = TicketSystem(self.env)
         listener = ts.milestone_change_listeners[0]
@@ -1512,6 +1649,30 @@ class ComponentTestCase(unittest.TestCase):
         self.assertEqual(exc_message, str(cm1.exception))
         self.assertFalse(component1.exists)
 
+    def test_delete_many(self):
+        """Delete several components at once."""
+        with self.env.db_transaction as db:
+            db("INSERT INTO component (name) VALUES ('component3')")
+
+        Component.delete_many(self.env, ['component1', 'component3'])
+        component_field = self._get_component_ticket_field()
+
+        self.assertEqual([('component2',)],
+                         self.env.db_query("SELECT name FROM component"))
+        self.assertIsNotNone(component_field)
+        self.assertEqual(['component2'], component_field['options'])
+
+    def test_delete_many_deleted_concurrently(self):
+        names = ['component1', 'component2']
+        Component(self.env, 'component2').delete()
+
+        with self.assertRaises(ResourceNotFound) as cm:
+            Component.delete_many(self.env, names)
+        self.assertEqual("Component component2 does not exist.",
+                         str(cm.exception))
+        self.assertEqual([('component1',)],
+                         self.env.db_query("SELECT name FROM component"))
+
     def test_insert(self):
         """Insert a new component."""
         component = Component(self.env)
@@ -1526,6 +1687,37 @@ class ComponentTestCase(unittest.TestCase):
         self.assertIsNotNone(component_field)
         self.assertIn('component3', component_field['options'])
 
+    def test_insert_many(self):
+        """Insert several components at once."""
+        component3 = Component(self.env)
+        component3.name = 'component3'
+        component4 = Component(self.env)
+        component4.name = ' component4 '
+        component4.owner = 'user4'
+        Component.insert_many(self.env, [component3, component4])
+        component_field = self._get_component_ticket_field()
+
+        self.assertTrue(component3.exists)
+        self.assertTrue(component4.exists)
+        self.assertEqual([('component3', None), ('component4', 'user4')],
+                         self.env.db_query("""
+            SELECT name, owner FROM component
+            WHERE name IN ('component3', 'component4') ORDER BY name"""))
+        self.assertIn('component4', component_field['options'])
+
+    def test_insert_many_existing_name(self):
+        """No component is inserted if one of the names already exists."""
+        component3 = Component(self.env)
+        component3.name = 'component3'
+        component1 = Component(self.env)
+        component1.name = 'component1'
+
+        self.assertRaises(ResourceExistsError, Component.insert_many,
+                          self.env, [component3, component1])
+        self.assertFalse(component3.exists)
+        self.assertEqual([], self.env.db_query("""
+            SELECT name FROM component WHERE name='component3'"""))
+
     def test_insert_whitespace_removed(self):
         """Whitespace is stripped from text fields when inserting component.
         """
@@ -1841,6 +2033,20 @@ class VersionTestCase(unittest.TestCase):
         self.assertEqual([('Test', 0, 'Some text')], self.env.db_query(
             "SELECT name, time, description FROM version WHERE name='Test'"))
 
+    def test_delete_many(self):
+        Version.delete_many(self.env, ['1.0', '2.0'])
+        self.assertEqual([], self.env.db_query("SELECT * FROM version"))
+
+    def test_delete_many_deleted_concurrently(self):
+        names = ['1.0', '2.0']
+        Version(self.env, '2.0').delete()
+
+        with self.assertRaises(ResourceNotFound) as cm:
+            Version.delete_many(self.env, names)
+        self.assertEqual("Version 2.0 does not exist.", str(cm.exception))
+        self.assertEqual([('1.0',)],
+                         self.env.db_query("SELECT name FROM version"))
+
 
 def test_suite():
     suite = unittest.TestSuite()
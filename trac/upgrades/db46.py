@@ -11,21 +11,26 @@
 # individuals. For the exact contribution history, see the revision
 # history and logs, available at https://trac.edgewall.org/.
 
-sql = [
-#-- Add 'started' value to 'milestone'
-"""CREATE TEMPORARY TABLE milestone_old AS SELECT * FROM milestone;""",
-"""DROP TABLE milestone;""",
-"""CREATE TABLE milestone (
-	name	text,
-	due	integer,
-	started	integer,
-	completed	integer,
-	description	text,
-	PRIMARY KEY(name)
-);""",
-"""INSERT INTO milestone(name,due,started,completed,description) SELECT name,due,0,completed,description FROM milestone_old;"""
-]
+from trac.db.api import DatabaseManager
+from trac.db.schema import Column, Table
+
 
 def do_upgrade(env, ver, cursor):
-    for s in sql:
-        cursor.execute(s)
\ No newline at end of file
+    """Add 'started' column to the 'milestone' table.
+
+    Existing milestones get `0` as start date, like a new milestone
+    without start date.
+    """
+    new_schema = [
+        Table('milestone', key='name')[
+            Column('name'),
+            Column('due', type='int64'),
+            Column('started', type='int64'),
+            Column('completed', type='int64'),
+            Column('description'),
+        ]
+    ]
+
+    with env.db_transaction as db:
+        DatabaseManager(env).upgrade_tables(new_schema)
+        db("UPDATE milestone SET started=0")
@@ -13,7 +13,8 @@
 
 import unittest
 
-from trac.upgrades.tests import db31, db32, db39, db41, db42, db44, db45
+from trac.upgrades.tests import db31, db32, db39, db41, db42, db44, db45, \
+                                db46
 
 
 def test_suite():
@@ -25,6 +26,7 @@ def test_suite():
     suite.addTest(db42.test_suite())
     suite.addTest(db44.test_suite())
     suite.addTest(db45.test_suite())
+    suite.addTest(db46.test_suite())
     return suite
 
 
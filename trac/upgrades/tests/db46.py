@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Edgewall Software
+# All rights reserved.
+#
+# This software is licensed as described in the file COPYING, which
+# you should have received as part of this distribution. The terms
+# are also available at https://trac.edgewall.org/wiki/TracLicense.
+#
+# This software consists of voluntary contributions made by many
+# individuals. For the exact contribution history, see the revision
+# history and logs, available at https://trac.edgewall.org/log/.
+
+import unittest
+
+from trac.db.api import DatabaseManager
+from trac.db.schema import Column, Table
+from trac.test import EnvironmentStub
+from trac.upgrades import db46
+
+VERSION = 46
+
+old_milestone_schema = \
+    Table('milestone', key='name')[
+        Column('name'),
+        Column('due', type='int64'),
+        Column('completed', type='int64'),
+        Column('description')]
+
+
+class UpgradeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.env = EnvironmentStub()
+        self.dbm = DatabaseManager(self.env)
+        with self.env.db_transaction:
+            self.dbm.drop_tables(('milestone',))
+            self.dbm.create_tables((old_milestone_schema,))
+            self.dbm.set_database_version(VERSION - 1)
+
+    def tearDown(self):
+        self.env.reset_db()
+
+    def _do_upgrade(self):
+        with self.env.db_transaction as db:
+            db46.do_upgrade(self.env, VERSION, db.cursor())
+
+    def test_started_column_added(self):
+        """The started column is added to the milestone table."""
+        self._do_upgrade()
+
+        self.assertEqual(['name', 'due', 'started', 'completed',
+                          'description'],
+                         self.dbm.get_column_names('milestone'))
+
+    def test_started_holds_microsecond_timestamps(self):
+        """The started column is large enough for a timestamp."""
+        self._do_upgrade()
+        started = 1656633600000000  # 2022-07-01T00:00:00Z
+        self.env.db_transaction("""
+            INSERT INTO milestone (name, due, started, completed, description)
+            VALUES ('milestone1', 0, %s, 0, '')""", (started,))
+
+        self.assertEqual([(started,)], self.env.db_query("""
+            SELECT started FROM milestone WHERE name='milestone1'"""))
+
+    def test_milestone_data_preserved(self):
+        """Existing milestones are kept and have 0 as start date."""
+        self.dbm.insert_into_tables((
+            ('milestone', ('name', 'due', 'completed', 'description'),
+             (('milestone1', 42, 0, 'the description'),
+              ('milestone2', 0, 43, None))),))
+
+        self._do_upgrade()
+
+        self.assertEqual([('milestone1', 42, 0, 0, 'the description'),
+                          ('milestone2', 0, 0, 43, None)],
+                         self.env.db_query("""
+            SELECT name, due, started, completed, description
+            FROM milestone ORDER BY name"""))
+
+
+def test_suite():
+    return unittest.makeSuite(UpgradeTestCase)
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='test_suite')
@@ -36,6 +36,19 @@ except ImportError:
                 return des_crypt.encrypt(secret, salt=salt)
 
 
+# str.isascii() is available since Python 3.7.
+try:
+    isascii = str.isascii
+except AttributeError:
+    def isascii(s):
+        try:
+            s.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        else:
+            return True
+
+
 def rpartition(s, sep):
     return s.rpartition(sep)
 
@@ -97,6 +97,10 @@ class ExpandtabsTestCase(unittest.TestCase):
         self.assertEqual('        ', expandtabs('       \t'))
         self.assertEqual('                ', expandtabs('\t\t'))
 
+    def test_ignoring_in_line(self):
+        x = expandtabs('\0a\1b\tc\td\n\te', 4, ignoring='\0\1')
+        self.assertEqual('\0a\1b  c   d\n    e', x)
+
 
 class JavascriptQuoteTestCase(unittest.TestCase):
     def test_quoting(self):
@@ -417,6 +421,15 @@ class StripwsTestCase(unittest.TestCase):
                          stripws(' \t\u3000stripws \u200b\t\u2008',
                                  leading=False, trailing=False))
 
+    def test_all_whitespace_chars(self):
+        ws = [c for c in map(chr, range(0x110000)) if c.isspace()]
+        ws.append('\u200b')
+        for c in ws:
+            self.assertEqual('x', stripws(c + 'x' + c), repr(c))
+            if c not in '\r\n':
+                self.assertEqual('x\nx', strip_line_ws(c + 'x' + c + '\n' +
+                                                       c + 'x' + c), repr(c))
+
 
 class Jinja2TemplateTestCase(unittest.TestCase):
     def test_html_template(self):
@@ -445,6 +458,17 @@ class Jinja2TemplateTestCase(unittest.TestCase):
              jinja2template("##${id}", text=True, line_statement_prefix=None,
                             line_comment_prefix=None).render({'id': 10}))
 
+    def test_environment_not_shared(self):
+        t1 = jinja2template("${id}", text=True, line_statement_prefix=None)
+        t1.environment.globals['id'] = 42
+        t1.environment.filters['twice'] = lambda v: v * 2
+        t2 = jinja2template("#${id}", text=True, line_statement_prefix=None)
+        self.assertIsNot(t1.environment, t2.environment)
+        self.assertEqual("42", t1.render())
+        self.assertEqual("#", t2.render())
+        self.assertNotIn('twice', t2.environment.filters)
+        self.assertEqual("#10", t2.render({'id': 10}))
+
 
 class LevenshteinDistanceTestCase(unittest.TestCase):
     def test_distance(self):
@@ -453,6 +477,9 @@ class LevenshteinDistanceTestCase(unittest.TestCase):
         self.assertEqual(2, levenshtein_distance('comfig', 'config'))
         self.assertEqual(5, levenshtein_distance('update', 'upgrade'))
         self.assertEqual(0, levenshtein_distance('milestone', 'milestone'))
+        self.assertEqual(3, levenshtein_distance('', 'abc'))
+        self.assertEqual(2, levenshtein_distance('ab' * 50, 'ba' + 'ab' * 49))
+        self.assertEqual(200, levenshtein_distance('a' * 100, 'b' * 100))
 
 
 class SubVarsTestCase(unittest.TestCase):
@@ -26,11 +26,15 @@ import pkg_resources
 import re
 import sys
 import textwrap
+from bisect import bisect_right
+from itertools import accumulate
 from urllib.parse import quote, quote_plus, unquote
 from unicodedata import east_asian_width
 
 import jinja2
 
+from trac.util.compat import isascii
+
 CRLF = '\r\n'
 
 class Empty(str):
@@ -159,8 +163,11 @@ def path_to_unicode(path):
     return str(path)
 
 
-_ws_leading_re = re.compile('\\A[\\s\u200b]+', re.UNICODE)
-_ws_trailing_re = re.compile('[\\s\u200b]+\\Z', re.UNICODE)
+# characters matched by `\s` in a Unicode regular expression, and ZWSP
+_ws_chars = '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680' \
+            '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008' \
+            '\u2009\u200a\u2028\u2029\u202f\u205f\u3000\u200b'
+_eol_split_re = re.compile(r'(\n|\r\n|\r)')
 
 def stripws(text, leading=True, trailing=True):
     """Strips unicode white-spaces and ZWSPs from ``text``.
@@ -171,9 +178,9 @@ def stripws(text, leading=True, trailing=True):
                      is `False`.
     """
     if leading:
-        text = _ws_leading_re.sub('', text)
+        text = text.lstrip(_ws_chars)
     if trailing:
-        text = _ws_trailing_re.sub('', text)
+        text = text.rstrip(_ws_chars)
     return text
 
 
@@ -185,11 +192,11 @@ def strip_line_ws(text, leading=True, trailing=True):
     :param trailing: strips trailing spaces from ``text`` unless ``trailing``
                      is `False`.
     """
-    lines = re.compile(r'(\n|\r\n|\r)').split(text)
+    lines = _eol_split_re.split(text)
     if leading:
-        lines[::2] = (_ws_leading_re.sub('', line) for line in lines[::2])
+        lines[::2] = (line.lstrip(_ws_chars) for line in lines[::2])
     if trailing:
-        lines[::2] = (_ws_trailing_re.sub('', line) for line in lines[::2])
+        lines[::2] = (line.rstrip(_ws_chars) for line in lines[::2])
     return ''.join(lines)
 
 
@@ -291,6 +298,8 @@ def to_utf8(text, charset='latin1'):
     already UTF-8, ISO Latin-1, or as specified by the optional
     *charset* parameter.
     """
+    if isinstance(text, str):
+        return text.encode('utf-8')
     if isinstance(text, bytes):
         try:
             u = str(text, 'utf-8')
@@ -399,9 +408,26 @@ def text_width(text, ambiwidth=1):
 
     cf. http://www.unicode.org/reports/tr11/.
     """
-    twice = 'FWA' if ambiwidth == 2 else 'FW'
-    return sum([2 if east_asian_width(chr) in twice else 1
-                for chr in to_unicode(text)])
+    text = to_unicode(text)
+    if isascii(text):
+        return len(text)
+    widths = _char_widths[2 if ambiwidth == 2 else 1]
+    return sum(map(widths.__getitem__, text))
+
+
+class _CharWidths(dict):
+    """Mapping of characters to their column width, computed on demand."""
+
+    def __init__(self, twice):
+        dict.__init__(self)
+        self.twice = twice
+
+    def __missing__(self, char):
+        width = self[char] = 2 if east_asian_width(char) in self.twice else 1
+        return width
+
+
+_char_widths = {1: _CharWidths('FW'), 2: _CharWidths('FWA')}
 
 
 def _get_default_ambiwidth():
@@ -482,28 +508,29 @@ def print_table(data, headers=None, sep='  ', out=None, ambiwidth=None):
     data = to_lines(data)
 
     num_cols = len(data[0])
-    col_width = [max(tw(row[idx]) for row in data)
-                 for idx in range(num_cols)]
+    cell_widths = [[tw(cell) for cell in row] for row in data]
+    col_width = [max(widths) for widths in zip(*cell_widths)]
+    sep_width = tw(sep)
 
-    out.write('\n')
+    parts = ['\n']
     for ridx, row in enumerate(data):
         for cidx, cell in enumerate(row):
             if cidx + 1 == num_cols:
-                line = cell  # No separator after last column
+                parts.append(cell)  # No separator after last column
             else:
                 if headers and ridx == 0:
-                    sp = ' ' * tw(sep)  # No separator in header
+                    sp = ' ' * sep_width  # No separator in header
                 else:
                     sp = sep
-                line = '%-*s%s' % (col_width[cidx] - tw(cell) + len(cell),
-                                    cell, sp)
-            out.write(line)
+                width = col_width[cidx] - cell_widths[ridx][cidx] + len(cell)
+                parts.append('%-*s%s' % (width, cell, sp))
 
-        out.write('\n')
+        parts.append('\n')
         if ridx == 0 and headers:
-            out.write('-' * (tw(sep) * cidx + sum(col_width)))
-            out.write('\n')
-    out.write('\n')
+            parts.append('-' * (sep_width * cidx + sum(col_width)))
+            parts.append('\n')
+    parts.append('\n')
+    out.write(''.join(parts))
 
 
 def shorten_line(text, maxlen=75):
@@ -588,6 +615,8 @@ class UnicodeTextWrapper(textwrap.TextWrapper):
         lines = []
         chunks.reverse()
         text_width = self._text_width
+        char_widths = _char_widths[2 if self.ambiwidth == 2 else 1]
+        rest = rest_width = None  # remainder of a broken chunk
 
         while chunks:
             cur_line = []
@@ -604,22 +633,21 @@ class UnicodeTextWrapper(textwrap.TextWrapper):
 
             while chunks:
                 chunk = chunks[-1]
-                w = text_width(chunk)
+                w = rest_width if chunk is rest else text_width(chunk)
                 if cur_width + w <= width:
                     cur_line.append(chunks.pop())
                     cur_width += w
                 elif self.breakable_re.match(chunk):
-                    left_space = width - cur_width
-                    for i in range(len(chunk)):
-                        w = text_width(chunk[i])
-                        if left_space < w:
-                            break
-                        left_space -= w
+                    # every character is at least one column wide, so
+                    # only the first `left_space + 1` ones are measured
+                    left_space = max(width - cur_width, 0)
+                    cum = list(accumulate(map(char_widths.__getitem__,
+                                              chunk[:left_space + 1])))
+                    i = bisect_right(cum, left_space)
                     if i > 0:
                         cur_line.append(chunk[:i])
-                        chunk = chunk[i:]
-                        chunks[-1] = chunk
-                    w = text_width(chunk)
+                        rest = chunks[-1] = chunk[i:]
+                        rest_width = w = w - cum[i - 1]
                     break
                 else:
                     break
@@ -769,16 +797,14 @@ def expandtabs(s, tabstop=8, ignoring=None):
             continue
         p = 0
         s = []
-        for c in line:
-            if c == '\t':
-                n = tabstop - p % tabstop
-                s.append(' ' * n)
-                p += n
-            elif not ignoring or c not in ignoring:
-                p += 1
-                s.append(c)
-            else:
-                s.append(c)
+        parts = line.split('\t')
+        for part in parts[:-1]:
+            p += len(part) - sum(part.count(c) for c in ignoring)
+            n = tabstop - p % tabstop
+            s.append(part)
+            s.append(' ' * n)
+            p += n
+        s.append(parts[-1])
         outlines.append(''.join(s))
     return '\n'.join(outlines)
 
@@ -814,22 +840,33 @@ def unicode_from_base64(text):
 
 
 def levenshtein_distance(lhs, rhs):
-    """Return the Levenshtein distance between two strings."""
+    """Return the Levenshtein distance between two strings.
+
+    A substitution counts as a deletion plus an insertion, so the
+    distance is `len(lhs) + len(rhs) - 2 * lcs`, `lcs` being the length
+    of the longest common subsequence. The latter is computed with a
+    bit-parallel algorithm (Hyyrö), processing one character of `rhs`
+    per iteration with a few operations on integers used as bit vectors.
+    """
+    if lhs == rhs:
+        return 0
     if len(lhs) > len(rhs):
         rhs, lhs = lhs, rhs
     if not lhs:
         return len(rhs)
 
-    prev = range(len(rhs) + 1)
-    for lidx, lch in enumerate(lhs):
-        curr = [lidx + 1]
-        for ridx, rch in enumerate(rhs):
-            cost = (lch != rch) * 2
-            curr.append(min(prev[ridx + 1] + 1, # deletion
-                            curr[ridx] + 1,     # insertion
-                            prev[ridx] + cost)) # substitution
-        prev = curr
-    return prev[-1]
+    peq = {}  # bit mask of the positions of each character in lhs
+    bit = 1
+    for ch in lhs:
+        peq[ch] = peq.get(ch, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    v = mask
+    for ch in rhs:
+        u = v & peq.get(ch, 0)
+        v = ((v + u) | (v - u)) & mask
+    lcs = len(lhs) - bin(v).count('1')
+    return len(lhs) + len(rhs) - 2 * lcs
 
 
 sub_vars_re = re.compile("[$]([A-Z_][A-Z0-9_]*)")